@@ -1,3 +1,74 @@
+import asyncio
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import List, Optional
+
+import httpx
+import numpy as np
+import pandas as pd
+import requests
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser as SelectolaxParser
+from urllib3.util.retry import Retry
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; prices fall back to np.fromiter
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _clean_prices_numba(buf: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """Accumulate the digit runs of each slice of a concatenated byte
+        buffer into float64 prices, NaN where a slice holds no digits."""
+        n = offsets.shape[0] - 1
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            value = 0
+            seen_digit = False
+            for j in range(offsets[i], offsets[i + 1]):
+                byte = buf[j]
+                if 48 <= byte <= 57:
+                    value = value * 10 + (byte - 48)
+                    seen_digit = True
+            out[i] = value if seen_digit else np.nan
+        return out
+
+else:
+    _clean_prices_numba = None
+
+# Parser contexts are reused across pages rather than rebuilt per parse, but
+# libxml2 parser contexts are not thread-safe, so each thread gets its own.
+# collect_ids/comments/PIs are disabled since nothing queries them.
+_parser_store = threading.local()
+
+
+def _parse_floorplan(content: bytes) -> Optional[str]:
+    """Extract the floorplan image URL from a (possibly truncated) detail
+    page body. Module-level so process pool workers can pickle it."""
+    node = SelectolaxParser(content).css_first("#floorplanTabs img")
+    return (node.attributes.get("src") or None) if node else None
+
+
+def _fromstring(content: bytes) -> html.HtmlElement:
+    """Parse HTML with a reusable per-thread parser."""
+    parser = getattr(_parser_store, "parser", None)
+    if parser is None:
+        parser = html.HTMLParser(collect_ids=False, remove_comments=True, remove_pis=True)
+        _parser_store.parser = parser
+    return html.fromstring(content, parser=parser)
+
+
 class TheRightmoveScraper:
     """The `RightmoveData` web scraper collects structured data on properties
     returned by a search performed on www.rightmove.co.uk.
@@ -9,14 +80,102 @@ class TheRightmoveScraper:
     The query to Rightmove can be renewed by calling the `refresh_data` method.
     """
 
-    
+    # Slots in place of a per-instance __dict__: users batch-scraping many
+    # saved searches create lots of these, and attribute access through slot
+    # descriptors is also slightly faster.
+    __slots__ = (
+        "_url",
+        "_get_floorplans",
+        "_status_code",
+        "_first_page",
+        "_first_tree",
+        "_results",
+        "_rent_or_sale",
+        "_xp_prices",
+    )
+
     POSTCODE_PATTERN = re.compile(r"\b([A-Za-z]{1,2}\d{1,2}[A-Za-z]?)\b")
     FULL_POSTCODE_PATTERN = re.compile(
         r"([A-Za-z]{1,2}\d{1,2}[A-Za-z]?\s\d{1}[A-Za-z]{2})"
     )
     BEDROOM_PATTERN = re.compile(r"\b(\d+)\b")
     PRICE_CLEAN_PATTERN = re.compile(r"[^\d]")
-    MAX_WORKERS = 10  
+    # One alternation covers all five accepted search URL shapes; the
+    # captured section doubles as the rent/sale classification key.
+    _URL_RE = re.compile(
+        r"https?://www\.rightmove\.co\.uk/"
+        r"(property-for-sale|property-to-rent|new-homes-for-sale|"
+        r"commercial-property-for-sale|commercial-property-to-let)/find\.html\?"
+    )
+    _SECTION_TO_KIND = {
+        "property-for-sale": "sale",
+        "new-homes-for-sale": "sale",
+        "property-to-rent": "rent",
+        "commercial-property-for-sale": "sale-commercial",
+        "commercial-property-to-let": "rent-commercial",
+    }
+    COLUMN_NAMES = ("price", "type", "address", "url", "agent_url", "floorplan_url")
+    # Columns scraped per search page; floorplan_url is filled in one batch
+    # across all pages afterwards.
+    _PAGE_COLUMN_NAMES = COLUMN_NAMES[:-1]
+    MAX_WORKERS = 10
+    # The floorplan fanout is latency-bound, so it gets a much higher cap
+    # than the page fetches: one event loop holds many sockets in flight
+    # where the old thread pool topped out at MAX_WORKERS.
+    FLOORPLAN_CONCURRENCY = 64
+    FLOORPLAN_CACHE_SIZE = 4096
+
+    # XPath queries compiled once at class load. smart_strings=False skips
+    # the proxy-string allocation on every result, which we never need since
+    # the extracted text is used as plain strings.
+    _XP_PRICES_SALE = etree.XPath(
+        '//div[@class="propertyCard-priceValue"]/text()', smart_strings=False
+    )
+    _XP_PRICES_RENT = etree.XPath(
+        '//span[@class="propertyCard-priceValue"]/text()', smart_strings=False
+    )
+    _XP_TITLES = etree.XPath(
+        '//div[@class="propertyCard-details"]//a[@class="propertyCard-link"]'
+        '//h2[@class="propertyCard-title"]/text()',
+        smart_strings=False,
+    )
+    _XP_ADDRESSES = etree.XPath(
+        '//address[@class="propertyCard-address"]//span/text()', smart_strings=False
+    )
+    _XP_WEBLINKS = etree.XPath(
+        '//div[@class="propertyCard-details"]//a[@class="propertyCard-link"]/@href',
+        smart_strings=False,
+    )
+    _XP_AGENT_URLS = etree.XPath(
+        '//div[@class="propertyCard-contact"]//a[@class="propertyCard-branchLogo-link"]/@href',
+        smart_strings=False,
+    )
+    _XP_RESULT_COUNT = etree.XPath(
+        "//span[@class='searchHeader-resultCount']/text()", smart_strings=False
+    )
+    HEADERS = {
+        'User-Agent': (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+            'AppleWebKit/537.36 (KHTML, like Gecko) '
+            'Chrome/70.0.3538.77 Safari/537.36'
+        )
+    }
+
+    # Shared session so every thread reuses the same keep-alive connection
+    # pool instead of paying a fresh TCP/TLS handshake per request.
+    _session = requests.Session()
+    _adapter = HTTPAdapter(
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    _session.mount("http://", _adapter)
+    _session.mount("https://", _adapter)
+
+    # In-process LRU of weblink -> floorplan URL. Repeated refresh_data
+    # calls and overlapping searches revisit the same listings, and their
+    # floorplans don't change, so cache hits skip the socket entirely.
+    _floorplan_cache: OrderedDict = OrderedDict()
 
     def __init__(self, url: str, get_floorplans: bool = False):
         """Initialize the scraper with a URL from the results of a property
@@ -31,26 +190,148 @@ class TheRightmoveScraper:
         self._get_floorplans = get_floorplans
         self._status_code, self._first_page = self._request(url)
         self._validate_url()
+        self._first_tree = _fromstring(self._first_page)
+        self._xp_prices = (
+            self._XP_PRICES_RENT if "rent" in self._rent_or_sale else self._XP_PRICES_SALE
+        )
         self._results = self._get_results(get_floorplans=get_floorplans)
 
-    @staticmethod
-    def _request(url: str) -> (Optional[int], Optional[bytes]):
+    @classmethod
+    def _request(cls, url: str) -> (Optional[int], Optional[bytes]):
         """Make an HTTP GET request to the specified URL."""
-        headers = {
-            'User-Agent': (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) '
-                'Chrome/70.0.3538.77 Safari/537.36'
-            )
-        }
         try:
-            response = requests.get(url, timeout=10, headers=headers)
+            response = cls._session.get(url, timeout=10, headers=cls.HEADERS)
             response.raise_for_status()
             return response.status_code, response.content
         except requests.RequestException as e:
             logger.error(f"Request failed for URL: {url}\nError: {e}")
             return None, None
 
+    @staticmethod
+    async def _arequest(
+        client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore
+    ) -> (Optional[int], Optional[bytes]):
+        """Make an HTTP GET request over a shared async client, gated by a
+        semaphore to bound the number of in-flight requests."""
+        async with semaphore:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                return response.status_code, response.content
+            except httpx.HTTPError as e:
+                logger.error(f"Request failed for URL: {url}\nError: {e}")
+                return None, None
+
+    async def _fetch_pages(self) -> List[bytes]:
+        """Fetch every result page concurrently over one pooled HTTP/2 client.
+
+        The first page was already downloaded by `__init__` for validation, so
+        only pages 2 onwards are requested here. A single client is kept open
+        for the whole scrape so TCP/TLS handshakes are not repaid per page.
+        """
+        page_urls = [f"{self.url}&index={p * 24}" for p in range(1, self.page_count)]
+        limits = httpx.Limits(
+            max_connections=self.MAX_WORKERS,
+            max_keepalive_connections=self.MAX_WORKERS,
+        )
+        async with httpx.AsyncClient(
+            limits=limits, http2=True, timeout=10, headers=self.HEADERS
+        ) as client:
+            semaphore = asyncio.Semaphore(self.MAX_WORKERS)
+            responses = await asyncio.gather(
+                *(self._arequest(client, url, semaphore) for url in page_urls)
+            )
+        contents = [self._first_page]
+        contents.extend(
+            content for status_code, content in responses
+            if status_code == 200 and content
+        )
+        return contents
+
+    def _get_results(self, get_floorplans: bool = False) -> pd.DataFrame:
+        """Scrape all pages of search results and return a cleaned DataFrame."""
+        page_contents = asyncio.run(self._fetch_pages())
+        # Pre-size the accumulators to the expected row count so the lists
+        # never reallocate as pages are spliced in. Pages can yield fewer
+        # than 24 rows after address filtering, so slots are filled through
+        # a running cursor and trimmed once at the end.
+        size = min(self.page_count * 24, self.results_count_display)
+        columns = {name: [None] * size for name in self._PAGE_COLUMN_NAMES}
+        cursor = 0
+        for content in page_contents:
+            page_columns = self._get_page(content)
+            length = len(page_columns["address"])
+            for name in self._PAGE_COLUMN_NAMES:
+                columns[name][cursor:cursor + length] = page_columns[name]
+            cursor += length
+        if cursor < size:
+            for name in self._PAGE_COLUMN_NAMES:
+                del columns[name][cursor:]
+        # One fanout over every listing URL instead of a batch per search
+        # page, so the keep-alive pool stays hot for the whole run.
+        if get_floorplans:
+            columns["floorplan_url"] = self._fetch_floorplans(columns["url"])
+        else:
+            columns["floorplan_url"] = [np.nan] * len(columns["url"])
+        results = pd.DataFrame(columns, copy=False)
+        return self._clean_results(results)
+
+    @classmethod
+    def _clean_results(cls, results: pd.DataFrame) -> pd.DataFrame:
+        """Parse prices to numbers and derive postcode/bedroom columns."""
+        if results.empty:
+            return results
+        results = results.reset_index(drop=True)
+        # Parse prices straight into a typed float64 array: np.fromiter with
+        # a known count writes each value into its final slot, skipping the
+        # object-dtype intermediate Series the string methods would allocate.
+        # float64 rather than int so missing prices stay NaN for dropna.
+        price_values = results["price"].tolist()
+        if _clean_prices_numba is not None:
+            results["price"] = cls._clean_prices_fast(price_values)
+        else:
+            results["price"] = np.fromiter(
+                (cls._clean_price(value) for value in price_values),
+                dtype=np.float64,
+                count=len(price_values),
+            )
+        results["postcode"] = results["address"].apply(cls._extract_postcode)
+        results["number_bedrooms"] = pd.to_numeric(
+            results["type"].str.extract(cls.BEDROOM_PATTERN, expand=False),
+            errors="coerce",
+        ).astype("Int16")
+        return results
+
+    @staticmethod
+    def _clean_prices_fast(values: List) -> np.ndarray:
+        """Clean every price in JIT-compiled code over one flat byte buffer.
+
+        The first call pays numba's compile cost (cached on disk); after
+        that the digit accumulation runs at C speed, which matters when many
+        saved searches are scraped in one process.
+        """
+        encoded = [value.encode() if isinstance(value, str) else b"" for value in values]
+        buf = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(piece) for piece in encoded], out=offsets[1:])
+        return _clean_prices_numba(buf, offsets)
+
+    @classmethod
+    def _clean_price(cls, value) -> float:
+        """Strip currency formatting from a price string, NaN if unparseable."""
+        if not isinstance(value, str):
+            return np.nan
+        digits = cls.PRICE_CLEAN_PATTERN.sub("", value)
+        return float(digits) if digits else np.nan
+
+    @classmethod
+    def _extract_postcode(cls, value):
+        """Extract a full or outward postcode from an address string."""
+        if not isinstance(value, str):
+            return np.nan
+        match = cls.FULL_POSTCODE_PATTERN.search(value) or cls.POSTCODE_PATTERN.search(value)
+        return match.group(1) if match else np.nan
+
     def refresh_data(self, url: Optional[str] = None, get_floorplans: bool = False):
         """Refresh the data by making a new GET request.
 
@@ -63,23 +344,22 @@ class TheRightmoveScraper:
         self._get_floorplans = get_floorplans
         self._status_code, self._first_page = self._request(self.url)
         self._validate_url()
+        self._first_tree = _fromstring(self._first_page)
+        self._xp_prices = (
+            self._XP_PRICES_RENT if "rent" in self._rent_or_sale else self._XP_PRICES_SALE
+        )
         self._results = self._get_results(get_floorplans=get_floorplans)
 
     def _validate_url(self):
-        """Validate that the URL is a valid Rightmove search URL."""
+        """Validate the URL is a Rightmove search URL and classify it."""
         if self._status_code != 200:
             raise ValueError(
                 f"Invalid Rightmove URL (status code {self._status_code}):\n\n\t{self.url}"
             )
-        url_patterns = [
-            r"https?://www\.rightmove\.co\.uk/property-for-sale/find\.html\?",
-            r"https?://www\.rightmove\.co\.uk/property-to-rent/find\.html\?",
-            r"https?://www\.rightmove\.co\.uk/new-homes-for-sale/find\.html\?",
-            r"https?://www\.rightmove\.co\.uk/commercial-property-for-sale/find\.html\?",
-            r"https?://www\.rightmove\.co\.uk/commercial-property-to-let/find\.html\?",
-        ]
-        if not any(re.match(pattern, self.url) for pattern in url_patterns):
+        match = self._URL_RE.match(self.url)
+        if not match:
             raise ValueError(f"Invalid Rightmove search URL:\n\n\t{self.url}")
+        self._rent_or_sale = self._SECTION_TO_KIND[match.group(1)]
 
     @property
     def url(self) -> str:
@@ -116,12 +396,16 @@ class TheRightmoveScraper:
             raise ValueError(f"Column not found in `get_results`: {by}")
 
         df = self.get_results.dropna(subset=["price"])
-        summary_df = df.groupby(by).agg({'price': ['count', 'mean']})
-        summary_df.columns = summary_df.columns.get_level_values(1)
-        summary_df.reset_index(inplace=True)
+        # sort=False skips the groupby sort pass (we sort on our own key
+        # below anyway) and observed=True avoids materializing unobserved
+        # categories if `by` is ever categorical.
+        summary_df = df.groupby(by, sort=False, observed=True, as_index=False).agg(
+            count=("price", "count"), mean=("price", "mean")
+        )
+        summary_df["count"] = summary_df["count"].astype(np.int32)
 
         if by == "number_bedrooms":
-            summary_df["number_bedrooms"] = summary_df["number_bedrooms"].astype(int)
+            summary_df["number_bedrooms"] = summary_df["number_bedrooms"].astype("Int8")
             summary_df.sort_values(by="number_bedrooms", inplace=True)
         else:
             summary_df.sort_values(by="count", ascending=False, inplace=True)
@@ -130,25 +414,13 @@ class TheRightmoveScraper:
 
     @property
     def rent_or_sale(self) -> str:
-        """Determine if the search is for properties for rent or sale."""
-        url = self.url
-        if "/property-for-sale/" in url or "/new-homes-for-sale/" in url:
-            return "sale"
-        elif "/property-to-rent/" in url:
-            return "rent"
-        elif "/commercial-property-for-sale/" in url:
-            return "sale-commercial"
-        elif "/commercial-property-to-let/" in url:
-            return "rent-commercial"
-        else:
-            raise ValueError(f"Invalid Rightmove URL:\n\n\t{self.url}")
+        """Whether the search is for properties for rent or sale."""
+        return self._rent_or_sale
 
     @property
     def results_count_display(self) -> int:
         """Total number of listings as displayed on the first page of results."""
-        tree = html.fromstring(self._first_page)
-        xpath = "//span[@class='searchHeader-resultCount']/text()"
-        result = tree.xpath(xpath)
+        result = self._XP_RESULT_COUNT(self._first_tree)
         if result:
             return int(result[0].replace(",", ""))
         else:
@@ -163,70 +435,127 @@ class TheRightmoveScraper:
             page_count += 1
         return min(page_count, 42) 
 
-    def _get_page(self, request_content: bytes, get_floorplans: bool = False) -> pd.DataFrame:
-        """Scrape data from a single page of search results."""
+    def _get_page(self, request_content: bytes) -> dict:
+        """Scrape a single page of search results into parallel column lists.
+
+        Returns a dict keyed by `_PAGE_COLUMN_NAMES`, already filtered to rows
+        with an address, so the caller can fill its accumulators and build one
+        DataFrame at the end instead of paying per-page construction costs.
+        """
         if not request_content:
-            return pd.DataFrame()
+            return {name: [] for name in self._PAGE_COLUMN_NAMES}
 
-        tree = html.fromstring(request_content)
+        tree = _fromstring(request_content)
         base = "https://www.rightmove.co.uk"
 
-        if "rent" in self.rent_or_sale:
-            xp_prices = '//span[@class="propertyCard-priceValue"]/text()'
-        else:
-            xp_prices = '//div[@class="propertyCard-priceValue"]/text()'
-
-        xp_titles = (
-            '//div[@class="propertyCard-details"]//a[@class="propertyCard-link"]'
-            '//h2[@class="propertyCard-title"]/text()'
-        )
-        xp_addresses = '//address[@class="propertyCard-address"]//span/text()'
-        xp_weblinks = '//div[@class="propertyCard-details"]//a[@class="propertyCard-link"]/@href'
-        xp_agent_urls = (
-            '//div[@class="propertyCard-contact"]//a[@class="propertyCard-branchLogo-link"]/@href'
-        )
-
-        # Extract data using XPaths
-        prices = tree.xpath(xp_prices)
-        titles = tree.xpath(xp_titles)
-        addresses = tree.xpath(xp_addresses)
-        weblinks = [f"{base}{link}" for link in tree.xpath(xp_weblinks)]
-        agent_urls = [f"{base}{link}" for link in tree.xpath(xp_agent_urls)]
-
-        if get_floorplans:
-            floorplan_urls = self._fetch_floorplans(weblinks)
-        else:
-            floorplan_urls = [np.nan] * len(weblinks)
+        # Extract data using the precompiled XPaths
+        prices = self._xp_prices(tree)
+        titles = self._XP_TITLES(tree)
+        addresses = self._XP_ADDRESSES(tree)
+        weblinks = [f"{base}{link}" for link in self._XP_WEBLINKS(tree)]
+        agent_urls = [f"{base}{link}" for link in self._XP_AGENT_URLS(tree)]
 
         max_length = max(len(prices), len(titles), len(addresses), len(weblinks), len(agent_urls))
-        data = {
+        columns = {
             "price": prices + [np.nan] * (max_length - len(prices)),
             "type": titles + [np.nan] * (max_length - len(titles)),
             "address": addresses + [np.nan] * (max_length - len(addresses)),
             "url": weblinks + [np.nan] * (max_length - len(weblinks)),
             "agent_url": agent_urls + [np.nan] * (max_length - len(agent_urls)),
-            "floorplan_url": floorplan_urls + [np.nan] * (max_length - len(floorplan_urls)),
         }
-        df = pd.DataFrame(data)
-        df.dropna(subset=["address"], inplace=True) 
-        return df
+        # Filter rows without an address here, on plain lists, instead of a
+        # full-frame dropna later. itemgetter gathers the kept indices in one
+        # C-level call per column.
+        keep = [
+            i for i, address in enumerate(columns["address"])
+            if isinstance(address, str) and address
+        ]
+        if len(keep) == max_length:
+            return columns
+        if not keep:
+            return {name: [] for name in self._PAGE_COLUMN_NAMES}
+        take = itemgetter(*keep)
+        if len(keep) == 1:
+            return {name: [take(values)] for name, values in columns.items()}
+        return {name: list(take(values)) for name, values in columns.items()}
 
     def _fetch_floorplans(self, weblinks: List[str]) -> List[Optional[str]]:
-        """Fetch floorplan URLs using multiple threads for efficiency."""
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            results = list(executor.map(self._get_floorplan_url, weblinks))
-        return results
+        """Fetch floorplan URLs for many listings concurrently."""
+        return asyncio.run(self._afetch_floorplans(weblinks))
+
+    async def _afetch_floorplans(self, weblinks: List[str]) -> List[Optional[str]]:
+        """Async fanout over listing detail pages on one pooled client.
 
-    def _get_floorplan_url(self, weblink: str) -> Optional[str]:
-        """Fetch floorplan URL for a single property listing."""
+        Downloads stay on the event loop while the HTML parsing — the only
+        CPU-bound step — is handed to a process pool, so parse throughput
+        scales with cores instead of contending for the GIL. Results are
+        memoized in `_floorplan_cache`; only cache misses hit the network.
+        """
+        cache = self._floorplan_cache
+        resolved = {}
+        for weblink in weblinks:
+            if weblink in cache:
+                cache.move_to_end(weblink)
+                resolved[weblink] = cache[weblink]
+        to_fetch = [weblink for weblink in dict.fromkeys(weblinks) if weblink not in resolved]
+        if to_fetch:
+            limits = httpx.Limits(
+                max_connections=self.FLOORPLAN_CONCURRENCY,
+                max_keepalive_connections=self.FLOORPLAN_CONCURRENCY,
+            )
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                async with httpx.AsyncClient(
+                    limits=limits, http2=True, timeout=10, headers=self.HEADERS
+                ) as client:
+                    semaphore = asyncio.Semaphore(self.FLOORPLAN_CONCURRENCY)
+                    fetched = await asyncio.gather(
+                        *(
+                            self._aget_floorplan_url(client, weblink, semaphore, loop, pool)
+                            for weblink in to_fetch
+                        )
+                    )
+            for weblink, floorplan_url in zip(to_fetch, fetched):
+                resolved[weblink] = floorplan_url
+                cache[weblink] = floorplan_url
+            while len(cache) > self.FLOORPLAN_CACHE_SIZE:
+                cache.popitem(last=False)
+        return [resolved[weblink] for weblink in weblinks]
+
+    async def _aget_floorplan_url(
+        self,
+        client: httpx.AsyncClient,
+        weblink: str,
+        semaphore: asyncio.Semaphore,
+        loop: asyncio.AbstractEventLoop,
+        pool: ProcessPoolExecutor,
+    ) -> Optional[str]:
+        """Fetch the floorplan URL for a single property listing.
+
+        The body is streamed and cut off as soon as a complete img tag has
+        arrived after the floorplanTabs marker; the tag sits partway down
+        the page, so on average this skips a large share of both the bytes
+        downloaded and the parse.
+        """
         try:
-            status_code, content = self._request(weblink)
-            if status_code != 200 or not content:
+            buffer = bytearray()
+            async with semaphore:
+                async with client.stream("GET", weblink) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        buffer += chunk
+                        marker = buffer.find(b"floorplanTabs")
+                        if marker == -1:
+                            continue
+                        img = buffer.find(b"<img", marker)
+                        if img != -1 and buffer.find(b">", img) != -1:
+                            break
+            if not buffer:
                 return np.nan
-            tree = html.fromstring(content)
-            xp_floorplan_url = '//*[@id="floorplanTabs"]//img/@src'
-            floorplan_url = tree.xpath(xp_floorplan_url)
-            return floorplan_url[0] if floorplan_url else np.nan
+            floorplan_url = await loop.run_in_executor(
+                pool, _parse_floorplan, bytes(buffer)
+            )
+            return floorplan_url if floorplan_url else np.nan
         except Exception as e:
             logger.error(f"Error getting floorplan for {weblink}: {e}")
             return np.nan